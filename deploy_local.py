@@ -4,71 +4,174 @@ Quick deployment script for local network sharing
 Run this script to start your Panel dashboard on your local network
 """
 
-import subprocess
+import asyncio
+import functools
+import logging
+import shutil
+import signal
 import socket
 import sys
 import os
 
+logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+def _probe_local_ip():
+    """Last-resort probe: ask the kernel which source address routes out"""
+    try:
+        # Connect to a remote address to determine local IP (UDP, no traffic sent)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(0.05)
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except OSError:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def get_hostname():
+    """Machine hostname, resolved once per process"""
+    return socket.gethostname()
+
+@functools.lru_cache(maxsize=1)
 def get_local_ip():
-    """Get the local IP address of the machine"""
+    """Get the local IP address of the machine (cached after the first call)"""
+    # Explicit override for containers/CI where discovery is unreliable
+    override = os.environ.get("LOCAL_IP")
+    if override:
+        return override
+    # Enumerate addresses of this host and prefer a non-loopback IPv4,
+    # so the lookup works offline without touching the network
     try:
-        # Connect to a remote address to determine local IP
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        local_ip = s.getsockname()[0]
-        s.close()
-        return local_ip
-    except Exception:
-        return "127.0.0.1"
-
-def main():
-    print("🚀 Panel Air Quality Dashboard - Local Deployment")
-    print("=" * 50)
-    
-    # Check if the dashboard file exists
-    if not os.path.exists("panel_air_quality_dashboard.py"):
-        print("❌ Error: panel_air_quality_dashboard.py not found!")
-        print("Make sure you're in the correct directory.")
-        sys.exit(1)
-    
-    # Check if the database exists
-    if not os.path.exists("air_quality.sqlite"):
-        print("❌ Error: air_quality.sqlite not found!")
-        print("Make sure your database file is in the current directory.")
-        sys.exit(1)
-    
+        for info in socket.getaddrinfo(get_hostname(), None, socket.AF_INET):
+            address = info[4][0]
+            if not address.startswith("127."):
+                return address
+    except socket.gaierror:
+        pass
+    try:
+        address = socket.gethostbyname(get_hostname())
+        if not address.startswith("127."):
+            return address
+    except socket.gaierror:
+        pass
+    # Some hosts only resolve their name to loopback; fall back to a route probe
+    return _probe_local_ip() or "127.0.0.1"
+
+REQUIRED_FILES = ("panel_air_quality_dashboard.py", "air_quality.sqlite")
+
+DEFAULT_PORT = 5006
+
+def port_is_free(port):
+    """Check whether the port can be bound before handing it to Panel"""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind(("0.0.0.0", port))
+        return True
+    except OSError:
+        return False
+
+@functools.lru_cache(maxsize=1)
+def missing_required_files():
+    """Names from REQUIRED_FILES absent in the cwd, computed once per process"""
+    try:
+        with os.scandir(".") as entries:
+            present = {entry.name for entry in entries}
+        return tuple(name for name in REQUIRED_FILES if name not in present)
+    except OSError:
+        # Directory not scannable: fall back to one stat per file, treating
+        # FileNotFoundError as the (cached) negative result
+        missing = []
+        for name in REQUIRED_FILES:
+            try:
+                os.stat(name)
+            except FileNotFoundError:
+                missing.append(name)
+        return tuple(missing)
+
+# Constant part of the server command; port and origins are appended per
+# run. Per-message deflate makes the repetitive inline CSS in the dashboard
+# HTML compress roughly an order of magnitude on the wire
+SERVE_CMD = (
+    "panel", "serve",
+    "panel_air_quality_dashboard.py",
+    "--address", "0.0.0.0",
+    "--websocket-compression-level", "9",
+)
+
+BANNER_TEMPLATE = """\
+🚀 Panel Air Quality Dashboard - Local Deployment
+{rule}
+📍 Local IP Address: {local_ip}
+🌐 Dashboard will be available at: http://{local_ip}:{port}/panel_air_quality_dashboard
+🔗 Local access: http://localhost:{port}/panel_air_quality_dashboard
+🔗 Hostname access: http://{hostname}:{port}/panel_air_quality_dashboard
+
+📋 Instructions for sharing:
+1. Share the URL above with others on your network
+2. They can access the dashboard from any device on the same WiFi/network
+3. Press Ctrl+C to stop the server
+
+{rule}
+🚀 Starting Panel server...
+"""
+
+async def main():
+    # Check that the dashboard and database exist (cached single scan)
+    for required in missing_required_files():
+        logger.error("%s not found! Make sure you're in the correct directory.", required)
+        return 1
+
+    # The server is exec'd as the 'panel' CLI, so check PATH upfront
+    # rather than catching FileNotFoundError after the fork
+    if shutil.which("panel") is None:
+        logger.error("'panel' command not found! Please install Panel: pip install panel")
+        return 1
+
     local_ip = get_local_ip()
-    port = 5006
-    
-    print(f"📍 Local IP Address: {local_ip}")
-    print(f"🌐 Dashboard will be available at: http://{local_ip}:{port}/panel_air_quality_dashboard")
-    print(f"🔗 Local access: http://localhost:{port}/panel_air_quality_dashboard")
-    print("\n📋 Instructions for sharing:")
-    print("1. Share the URL above with others on your network")
-    print("2. They can access the dashboard from any device on the same WiFi/network")
-    print("3. Press Ctrl+C to stop the server")
-    print("\n" + "=" * 50)
-    
     try:
-        # Start the Panel server
-        cmd = [
-            "panel", "serve", 
-            "panel_air_quality_dashboard.py",
-            "--address", "0.0.0.0",
-            "--port", str(port),
-            "--allow-websocket-origin=*"
-        ]
-        
-        print("🚀 Starting Panel server...")
-        subprocess.run(cmd)
-        
-    except KeyboardInterrupt:
-        print("\n\n🛑 Server stopped by user")
-    except FileNotFoundError:
-        print("❌ Error: 'panel' command not found!")
-        print("Please install Panel: pip install panel")
-    except Exception as e:
-        print(f"❌ Error starting server: {e}")
+        port = int(os.environ.get("PORT", DEFAULT_PORT))
+    except ValueError:
+        logger.error("Invalid PORT value: %s", os.environ["PORT"])
+        return 1
+
+    # Fail fast with a clear message instead of letting Panel crash on bind
+    if not port_is_free(port):
+        logger.error("Port %s is already in use; set PORT to pick another.", port)
+        return 1
+
+    # One formatted write instead of a dozen line-buffered print calls
+    sys.stdout.write(BANNER_TEMPLATE.format(
+        rule="=" * 50, local_ip=local_ip, hostname=get_hostname(), port=port
+    ))
+    sys.stdout.flush()
+
+    # Only accept websocket connections from hosts we actually serve on,
+    # instead of the wildcard origin
+    origins = [f"localhost:{port}", f"127.0.0.1:{port}", f"{local_ip}:{port}"]
+    hostname = get_hostname()
+    if hostname:
+        origins.append(f"{hostname}:{port}")
+
+    # Run the Panel server as a supervised child: the wrapper stays free
+    # to forward signals and observe the exit status without blocking in
+    # a C-level wait
+    proc = await asyncio.create_subprocess_exec(
+        *SERVE_CMD,
+        "--port", str(port),
+        *[f"--allow-websocket-origin={origin}" for origin in origins],
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, proc.terminate)
+
+    returncode = await proc.wait()
+    if returncode not in (0, -signal.SIGINT, -signal.SIGTERM):
+        logger.error("Panel server exited with status %s", returncode)
+        return 1
+    logger.info("Server stopped")
+    return 0
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(asyncio.run(main())) 
\ No newline at end of file
@@ -1,42 +1,86 @@
+import bisect
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
 import panel as pn
 import pandas as pd
+import re
 import sqlite3
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 # Configure Panel
 pn.extension('plotly', sizing_mode='stretch_width')
 
 # --- DATA LOADING FUNCTIONS ---
+# Only the columns the dashboard actually renders; region, wind_speed and
+# pressure never leave the database
+_LOAD_QUERY = """\
+SELECT datetime, site, latitude, longitude, co, no2, o3, pm10, pm25, so2,
+       temperature, humidity
+FROM defra_uk_air_quality
+ORDER BY datetime"""
+
+def _open():
+    """Open the database tuned for read-only dashboard access"""
+    # mode=ro makes the read-only contract explicit at the VFS level and
+    # cache=shared lets any further connections in this process reuse one
+    # page cache instead of each paging the file in separately
+    conn = sqlite3.connect(
+        "file:air_quality.sqlite?mode=ro&cache=shared",
+        uri=True,
+        check_same_thread=False,
+    )
+    # Read-tuned PRAGMAs: bigger page cache, mmap'd reads, in-memory temp
+    # tables, no fsync waits. journal_mode is left alone so a read-only
+    # dashboard never rewrites the database header.
+    conn.execute("PRAGMA query_only=1")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
 @pn.cache
-def load_latest_data():
-    """Load latest air quality data from SQLite database"""
-    conn = sqlite3.connect("air_quality.sqlite")
-    df = pd.read_sql_query("SELECT * FROM defra_uk_air_quality", conn)
+def _load_all():
+    """Read the projected air quality table from SQLite once and share it"""
+    conn = _open()
+    # Parse timestamps during row assembly so the column lands as
+    # datetime64[ns] without a second pass
+    df = pd.read_sql_query(_LOAD_QUERY, conn, parse_dates=["datetime"])
     conn.close()
-    df["datetime"] = pd.to_datetime(df["datetime"])
-    # Get latest for each site
-    latest = df.sort_values("datetime").groupby("site").tail(1)
-    return latest
+    # float32 is ample for sensor readings and halves the bytes every
+    # mask, groupby and Plotly serialization pass has to touch
+    for col in ("co", "no2", "o3", "pm10", "pm25", "so2",
+                "temperature", "humidity", "latitude", "longitude"):
+        df[col] = df[col].astype("float32", copy=False)
+    # Low-cardinality site names compare as integer codes once categorical
+    df["site"] = df["site"].astype("category")
+    return df
 
-@pn.cache
 def load_historical_data():
     """Load historical data for trends"""
-    conn = sqlite3.connect("air_quality.sqlite")
-    df = pd.read_sql_query("SELECT * FROM defra_uk_air_quality", conn)
-    conn.close()
-    df["datetime"] = pd.to_datetime(df["datetime"])
-    return df
+    return _load_all()
+
+def load_latest_data():
+    """Latest air quality reading for each site, derived from the shared frame"""
+    # Rows arrive ordered by datetime from SQL, so no re-sort is needed
+    return _load_all().groupby("site", sort=False).tail(1)
 
 # Load data
 latest_data = load_latest_data()
 historical_data = load_historical_data()
-cities = sorted(latest_data["site"].unique())
+# Categorical categories are already lexically sorted and deduplicated
+cities = latest_data["site"].cat.categories.tolist()
+
 
 # --- AQI CALCULATION FUNCTIONS ---
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    njit = None
+
 def calc_aqi(pm25):
     """Calculate AQI based on PM2.5 using US EPA standards"""
     if pm25 <= 12:
@@ -56,20 +100,73 @@ def calc_aqi(pm25):
     else:
         return 500
 
+if njit is not None:
+    # Compile the branch ladder to native code; warm the on-disk cache at
+    # import so the first request doesn't pay compilation cost
+    calc_aqi = njit(cache=True)(calc_aqi)
+    calc_aqi(10.0)
+
+# US EPA PM2.5 breakpoints with the AQI start value and span of each bracket,
+# mirroring the branches of calc_aqi above
+PM_BP = np.array([0, 12, 35.4, 55.4, 150.4, 250.4, 350.4, 500.4])
+AQI_START = np.array([0, 50, 100, 150, 200, 300, 400])
+AQI_SPAN = np.array([50, 50, 50, 100, 100, 100, 100])
+
+def calc_aqi_vec(pm25):
+    """Vectorized calc_aqi: convert a whole PM2.5 array in one NumPy pass"""
+    pm25 = np.asarray(pm25, dtype=np.float64)
+    idx = np.clip(np.searchsorted(PM_BP, pm25, side='left') - 1, 0, len(PM_BP) - 2)
+    aqi = AQI_START[idx] + (pm25 - PM_BP[idx]) * AQI_SPAN[idx] / (PM_BP[idx + 1] - PM_BP[idx])
+    return np.minimum(aqi, 500).astype(np.int32)
+
+# AQI category table: upper limit of each band and its
+# (status, emoji, color, background) row, indexable via searchsorted
+_AQI_LIMITS = np.array([50, 100, 150, 200, 300])
+_AQI_STATUS = np.array([
+    ("Good", "😊", "#00e400", "#e8f5e8"),
+    ("Moderate", "😐", "#ffff00", "#fffde7"),
+    ("Unhealthy for Sensitive Groups", "😷", "#ff7e00", "#fff3e0"),
+    ("Unhealthy", "😷", "#ff0000", "#ffebee"),
+    ("Very Unhealthy", "🤢", "#8f3f97", "#f3e5f5"),
+    ("Hazardous", "☠️", "#7e0023", "#fce4ec"),
+], dtype=object)
+
+def get_aqi_status_vec(aqi):
+    """Status rows for a whole AQI array in one searchsorted gather"""
+    return _AQI_STATUS[np.searchsorted(_AQI_LIMITS, aqi)]
+
+# Plain-Python mirrors of the band table for the scalar path, where
+# bisect on a small list beats dispatching into numpy for one value
+_AQI_LIMITS_LIST = _AQI_LIMITS.tolist()
+_AQI_STATUS_TUPLES = tuple(tuple(row) for row in _AQI_STATUS)
+
 def get_aqi_status(aqi):
     """Get AQI status, emoji, and color"""
-    if aqi <= 50:
-        return ("Good", "😊", "#00e400", "#e8f5e8")
-    elif aqi <= 100:
-        return ("Moderate", "😐", "#ffff00", "#fffde7")
-    elif aqi <= 150:
-        return ("Unhealthy for Sensitive Groups", "😷", "#ff7e00", "#fff3e0")
-    elif aqi <= 200:
-        return ("Unhealthy", "😷", "#ff0000", "#ffebee")
-    elif aqi <= 300:
-        return ("Very Unhealthy", "🤢", "#8f3f97", "#f3e5f5")
-    else:
-        return ("Hazardous", "☠️", "#7e0023", "#fce4ec")
+    return _AQI_STATUS_TUPLES[bisect.bisect_left(_AQI_LIMITS_LIST, aqi)]
+
+# Precompute AQI and its status row for every site in one vectorized
+# pass, so callbacks read ready-made values instead of recomputing them
+latest_data = latest_data.assign(aqi=calc_aqi_vec(latest_data["pm25"].to_numpy()))
+_status_rows = get_aqi_status_vec(latest_data["aqi"].to_numpy())
+latest_data = latest_data.assign(
+    status=_status_rows[:, 0],
+    emoji=_status_rows[:, 1],
+    color=_status_rows[:, 2],
+    bg_color=_status_rows[:, 3],
+)
+
+# Per-site lookups built once so callbacks avoid O(N) boolean masks.
+# Rows are already in datetime order from the SQL read, so the per-site
+# frames come out pre-sorted.
+HIST_BY_SITE = {
+    site: frame.reset_index(drop=True)
+    for site, frame in historical_data.groupby("site", sort=False)
+}
+LATEST_BY_SITE = {row.site: row for row in latest_data.itertuples(index=False)}
+
+# Version token for rendered-HTML caches: changes when fresher rows are
+# loaded, so stale card HTML can never be served after a data refresh
+_DATA_VERSION = latest_data["datetime"].max().isoformat()
 
 # --- INTERACTIVE COMPONENTS ---
 city_selector = pn.widgets.Select(
@@ -106,19 +203,8 @@ time_range = pn.widgets.Select(
 )
 
 # --- MAP CREATION ---
-def create_map(city=None):
-    """Create interactive map with air quality data"""
-    if city and city in latest_data['site'].values:
-        # Filter data for selected city
-        city_data = latest_data[latest_data['site'] == city].iloc[0]
-        center_lat = city_data['latitude']
-        center_lon = city_data['longitude']
-        zoom = 11  # Closer zoom for selected city
-    else:
-        # Default UK view
-        center_lat, center_lon, zoom = 54.5, -3, 5.5
-    
-    # Create map with all cities
+def _build_base_map():
+    """Run the plotly.express pipeline once for the all-cities base map"""
     fig = px.scatter_map(
         latest_data,
         lat='latitude',
@@ -128,27 +214,9 @@ def create_map(city=None):
         color='pm25',
         color_continuous_scale='RdYlGn_r',
         size='pm25',
-        zoom=zoom,
-        center={'lat': center_lat, 'lon': center_lon}
+        zoom=5.5,
+        center={'lat': 54.5, 'lon': -3}  # Default UK view
     )
-    
-    # Highlight selected city with larger, prominent marker
-    if city and city in latest_data['site'].values:
-        city_data = latest_data[latest_data['site'] == city].iloc[0]
-        fig.add_trace(go.Scattermap(
-            lat=[city_data['latitude']],
-            lon=[city_data['longitude']],
-            mode='markers',
-            marker=dict(
-                size=30,
-                color='#ff0000',
-                symbol='circle'
-            ),
-            name=city,
-            showlegend=False,
-            hovertemplate=f'<b>{city}</b><br>Selected City<br>PM2.5: {city_data["pm25"]:.1f} µg/m³<extra></extra>'
-        ))
-    
     fig.update_layout(
         map_style='carto-positron',
         height=450,
@@ -156,23 +224,49 @@ def create_map(city=None):
         showlegend=False,
         coloraxis_showscale=False
     )
-    
-    return fig
+    return fig.to_plotly_json()
 
-# --- AQI CARD CREATION ---
-def create_aqi_card(city):
-    """Create AQI status card"""
-    if city not in latest_data['site'].values:
-        return "City data not available"
-    
-    city_data = latest_data[latest_data['site'] == city].iloc[0]
-    aqi = calc_aqi(city_data['pm25'])
-    status, emoji, color, bg_color = get_aqi_status(aqi)
-    
-    # Format last updated time
-    last_updated = city_data['datetime'].strftime("%d %b %H:%M")
-    
-    card_html = f"""
+# City-independent map spec, encoded once at import; per-city calls only
+# adjust center/zoom and append the highlight trace
+_BASE_MAP = _build_base_map()
+
+@pn.cache
+def create_map(city=None):
+    """Create interactive map with air quality data"""
+    if not city or city not in LATEST_BY_SITE:
+        # Default UK view is exactly the prebuilt base spec
+        return _BASE_MAP
+
+    # Look up the selected city directly
+    city_data = LATEST_BY_SITE[city]
+
+    # Share the base traces; copy only the layout pieces being overridden
+    data = list(_BASE_MAP['data'])
+    # Highlight selected city with larger, prominent marker
+    data.append({
+        'type': 'scattermap',
+        'lat': [city_data.latitude],
+        'lon': [city_data.longitude],
+        'mode': 'markers',
+        'marker': {'size': 30, 'color': '#ff0000', 'symbol': 'circle'},
+        'name': city,
+        'showlegend': False,
+        'hovertemplate': f'<b>{city}</b><br>Selected City<br>PM2.5: {city_data.pm25:.1f} µg/m³<extra></extra>',
+    })
+
+    layout = dict(_BASE_MAP['layout'])
+    layout['map'] = dict(layout['map'],
+                         center={'lat': city_data.latitude, 'lon': city_data.longitude},
+                         zoom=11)  # Closer zoom for selected city
+
+    return {'data': data, 'layout': layout}
+
+def _minify_html(html):
+    """Collapse indentation/newlines in a static HTML template"""
+    return re.sub(r"\s*\n\s*", " ", html).strip()
+
+# Static chrome of the AQI card; only the handful of named fields vary
+_AQI_CARD_TEMPLATE = _minify_html("""
     <div style="
         background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 50%, #e9ecef 100%);
         border-radius: 20px;
@@ -206,11 +300,11 @@ def create_aqi_card(city):
                 <div style="text-align: left; display: flex; gap: 30px;">
                     <div>
                         <div style="font-size: 0.9rem; color: #666; margin-bottom: 2px;">PM10</div>
-                        <div style="font-size: 1.1rem; font-weight: bold; color: #333;">{city_data['pm10']:.1f} µg/m³</div>
+                        <div style="font-size: 1.1rem; font-weight: bold; color: #333;">{pm10:.1f} µg/m³</div>
                     </div>
                     <div>
                         <div style="font-size: 0.9rem; color: #666; margin-bottom: 2px;">PM2.5</div>
-                        <div style="font-size: 1.1rem; font-weight: bold; color: #333;">{city_data['pm25']:.1f} µg/m³</div>
+                        <div style="font-size: 1.1rem; font-weight: bold; color: #333;">{pm25:.1f} µg/m³</div>
                     </div>
                 </div>
             </div>
@@ -219,8 +313,8 @@ def create_aqi_card(city):
             <div style="flex: 1; background: linear-gradient(135deg, #e3f2fd, #bbdefb); border-radius: 12px; padding: 15px; border: 1px solid #e0e0e0;">
                 <div style="text-align: center;">
                     <div style="font-size: 1.3rem; margin-bottom: 3px;">☁️</div>
-                    <div style="font-size: 1.3rem; font-weight: bold; color: #333; margin-bottom: 3px;">{city_data['temperature']:.1f}°C</div>
-                    <div style="font-size: 0.8rem; color: #666; margin-bottom: 2px;">Humidity: {city_data['humidity']:.1f}%</div>
+                    <div style="font-size: 1.3rem; font-weight: bold; color: #333; margin-bottom: 3px;">{temperature:.1f}°C</div>
+                    <div style="font-size: 0.8rem; color: #666; margin-bottom: 2px;">Humidity: {humidity:.1f}%</div>
                     <div style="font-size: 0.8rem; color: #666;">Wind: 14 km/h</div>
                 </div>
             </div>
@@ -246,99 +340,140 @@ def create_aqi_card(city):
             </div>
         </div>
     </div>
-    """
+    """)
+
+# --- AQI CARD CREATION ---
+@functools.lru_cache(maxsize=64)
+def _render_aqi_card(city, data_version):
+    """Create AQI status card"""
+    if city not in LATEST_BY_SITE:
+        return "City data not available"
+
+    city_data = LATEST_BY_SITE[city]
+    aqi = city_data.aqi
+    status, color = city_data.status, city_data.color
+
+    # Format last updated time
+    last_updated = city_data.datetime.strftime("%d %b %H:%M")
     
-    return card_html
+    return _AQI_CARD_TEMPLATE.format_map({
+        'city': city,
+        'last_updated': last_updated,
+        'aqi': aqi,
+        'status': status,
+        'color': color,
+        'pm10': city_data.pm10,
+        'pm25': city_data.pm25,
+        'temperature': city_data.temperature,
+        'humidity': city_data.humidity,
+    })
+
+def create_aqi_card(city):
+    """AQI card HTML, cached per (city, data version)"""
+    return _render_aqi_card(city, _DATA_VERSION)
 
 # --- TREND CHARTS ---
-def create_trend_chart(city, time_range):
-    """Create AQI trend chart"""
-    if city not in historical_data['site'].values:
-        return go.Figure()
-    
-    # Filter data for selected city and time range
-    city_data = historical_data[historical_data['site'] == city].copy()
-    
+@pn.cache
+def _trend_chart(city, time_range, hour_bucket):
+    """Trend chart spec, cached per (city, range, wall-clock hour)"""
+    if city not in HIST_BY_SITE:
+        return {'data': [], 'layout': {}}
+
+    # Pre-sliced per-city frame, already sorted by datetime
+    city_data = HIST_BY_SITE[city]
+
     if time_range == 'Last 24 Hours':
-        cutoff = datetime.now() - timedelta(hours=24)
+        cutoff = hour_bucket - pd.Timedelta(hours=24)
     elif time_range == 'Last 7 Days':
-        cutoff = datetime.now() - timedelta(days=7)
+        cutoff = hour_bucket - pd.Timedelta(days=7)
     else:  # Last 30 Days
-        cutoff = datetime.now() - timedelta(days=30)
-    
-    city_data = city_data[city_data['datetime'] >= cutoff].sort_values('datetime')
-    
-    if city_data.empty:
-        return go.Figure()
-    
-    # Calculate AQI for each data point
-    city_data['aqi'] = city_data['pm25'].apply(calc_aqi)
-    
-    fig = go.Figure()
-    
-    # Add AQI line
-    fig.add_trace(go.Scatter(
-        x=city_data['datetime'],
-        y=city_data['aqi'],
-        mode='lines+markers',
-        name='AQI',
-        line=dict(color='#667eea', width=3),
-        marker=dict(size=6)
-    ))
-    
-    # Add PM2.5 line
-    fig.add_trace(go.Scatter(
-        x=city_data['datetime'],
-        y=city_data['pm25'],
-        mode='lines+markers',
-        name='PM2.5 (µg/m³)',
-        line=dict(color='#ff6b6b', width=2),
-        marker=dict(size=4),
-        yaxis='y2'
-    ))
-    
-    fig.update_layout(
-        title=f'AQI Trend - {city}',
-        height=300,
-        xaxis_title='Time',
-        yaxis_title='AQI',
-        yaxis2=dict(title='PM2.5 (µg/m³)', overlaying='y', side='right'),
-        hovermode='x unified',
-        showlegend=True,
-        legend=dict(x=0.02, y=0.98)
-    )
+        cutoff = hour_bucket - pd.Timedelta(days=30)
     
-    return fig
+    # Binary-search the cutoff in the pre-sorted frame and take array
+    # views; no intermediate DataFrame is materialized
+    times = city_data['datetime'].to_numpy()
+    start = times.searchsorted(np.datetime64(cutoff))
+
+    if start >= len(times):
+        return {'data': [], 'layout': {}}
+
+    x = times[start:]
+    pm25 = city_data['pm25'].to_numpy()[start:]
+    # Calculate AQI for the whole column in one vectorized pass
+    aqi = calc_aqi_vec(pm25)
+
+    # Plain dict spec: same structure as the graph_objects tree but
+    # without per-attribute validation
+    return {
+        'data': [
+            {
+                'type': 'scattergl',
+                'x': x,
+                'y': aqi,
+                'mode': 'lines+markers',
+                'name': 'AQI',
+                'line': {'color': '#667eea', 'width': 3},
+                'marker': {'size': 6},
+            },
+            {
+                'type': 'scattergl',
+                'x': x,
+                'y': pm25,
+                'mode': 'lines+markers',
+                'name': 'PM2.5 (µg/m³)',
+                'line': {'color': '#ff6b6b', 'width': 2},
+                'marker': {'size': 4},
+                'yaxis': 'y2',
+            },
+        ],
+        'layout': {
+            'uirevision': 'constant',
+            'title': {'text': f'AQI Trend - {city}'},
+            'height': 300,
+            'xaxis': {'title': {'text': 'Time'}},
+            'yaxis': {'title': {'text': 'AQI'}},
+            'yaxis2': {'title': {'text': 'PM2.5 (µg/m³)'}, 'overlaying': 'y', 'side': 'right'},
+            'hovermode': 'x unified',
+            'showlegend': True,
+            'legend': {'x': 0.02, 'y': 0.98},
+        },
+    }
+
+def create_trend_chart(city, time_range):
+    """Create AQI trend chart"""
+    # Same hour-bucket key as _hist_aqi_series: the cached window tracks
+    # wall-clock time instead of freezing at first computation
+    hour_bucket = pd.Timestamp.now().floor('h')
+    return _trend_chart(city, time_range, hour_bucket)
 
+@pn.cache
 def create_pollutants_chart(city):
     """Create pollutants comparison chart"""
-    if city not in latest_data['site'].values:
-        return go.Figure()
-    
-    city_data = latest_data[latest_data['site'] == city].iloc[0]
-    
+    if city not in LATEST_BY_SITE:
+        return {'data': [], 'layout': {}}
+
+    city_data = LATEST_BY_SITE[city]
+
     pollutants = ['PM2.5', 'PM10', 'NO₂', 'O₃']
-    values = [city_data['pm25'], city_data['pm10'], city_data['no2'], city_data['o3']]
+    values = [city_data.pm25, city_data.pm10, city_data.no2, city_data.o3]
     colors = ['#ff6b6b', '#4ecdc4', '#45b7d1', '#96ceb4']
-    
-    fig = go.Figure(data=[
-        go.Bar(
-            x=pollutants,
-            y=values,
-            marker_color=colors,
-            text=[f'{v:.1f}' for v in values],
-            textposition='auto',
-        )
-    ])
-    
-    fig.update_layout(
-        title=f'Current Pollutant Levels - {city}',
-        height=300,
-        yaxis_title='Concentration (µg/m³)',
-        showlegend=False
-    )
-    
-    return fig
+
+    return {
+        'data': [{
+            'type': 'bar',
+            'x': pollutants,
+            'y': values,
+            'marker': {'color': colors},
+            'text': [f'{v:.1f}' for v in values],
+            'textposition': 'auto',
+        }],
+        'layout': {
+            'title': {'text': f'Current Pollutant Levels - {city}'},
+            'height': 300,
+            'yaxis': {'title': {'text': 'Concentration (µg/m³)'}},
+            'showlegend': False,
+        },
+    }
 
 # --- DASHBOARD LAYOUT ---
 # Create a header with Panel widgets properly embedded
@@ -374,127 +509,132 @@ header = pn.Row(
 # Controls row is no longer needed since dropdowns are in header
 controls = pn.Row(align='center')
 
-# Map section
-map_pane = pn.pane.Plotly(create_map(cities[0] if cities else None), height=450)
+# The five component builders are independent, so run them on a small
+# pool: the initial build of each component starts as soon as its builder
+# exists and overlaps the rest of module import, and city changes reuse
+# the same pool from the update callback. panel serve re-executes this
+# script per browser session, so the pool lives in pn.state.cache to be
+# shared across sessions instead of leaking five threads per page load
+_POOL = pn.state.cache.setdefault('pool', ThreadPoolExecutor(max_workers=5))
+
+_INITIAL_CITY = cities[0] if cities else None
+
+# Map section (pane is assembled with the other initial builds below)
+_map_future = _POOL.submit(create_map, _INITIAL_CITY)
 
 # AQI Card (will be updated dynamically) - centered like AQI.in
-aqi_card = pn.pane.HTML(create_aqi_card(cities[0] if cities else None))
+_aqi_card_future = _POOL.submit(create_aqi_card, _INITIAL_CITY)
 
 # Create pollutant cards function
+def _placeholder_graph(text):
+    """Dict spec for an empty graph with a centered message"""
+    return {
+        'data': [],
+        'layout': {
+            'annotations': [{
+                'text': text,
+                'xref': 'paper', 'yref': 'paper',
+                'x': 0.5, 'y': 0.5, 'showarrow': False,
+                'font': {'size': 14, 'color': 'gray'},
+            }],
+            'plot_bgcolor': 'white',
+            'paper_bgcolor': 'white',
+            'height': 200,
+            'showlegend': False,
+            'xaxis': {'visible': False},
+            'yaxis': {'visible': False},
+        },
+    }
+
+@functools.lru_cache(maxsize=128)
+def _hist_aqi_series(city, hour_bucket):
+    """Windowed (times, aqi) arrays for a city, cached per wall-clock hour.
+
+    The hour bucket keys the cache so entries naturally expire if the
+    process ever starts refreshing its data; within an hour repeated
+    city switches reuse the computed window.
+    """
+    city_data = HIST_BY_SITE.get(city)
+
+    if city_data is None or city_data.empty:
+        return None
+
+    # Get the last 24 hours of data for better synchronization; the
+    # per-site frame is pre-sorted, so slice via binary search. Plotly
+    # only needs the two columns, so work on array views and never copy
+    # the frame
+    times = city_data['datetime'].to_numpy()
+    cutoff_time = times[-1] - np.timedelta64(24, 'h')
+    start = times.searchsorted(cutoff_time)
+
+    # If we don't have 24 hours of data, get the last 20 data points
+    if len(times) - start < 5:
+        start = max(len(times) - 20, 0)
+
+    if start >= len(times):
+        return None
+
+    # Calculate AQI for the whole window in one vectorized pass
+    return times[start:], calc_aqi_vec(city_data['pm25'].to_numpy()[start:])
+
 def create_historical_aqi_graph(city):
     """Create historical AQI graph for a city - synchronized with original data"""
     if not city:
         return None
-    
-    # Get historical data for the city
-    df = load_historical_data()
-    city_data = df[df['site'] == city].copy()
-    
-    if city_data.empty:
+
+    hour_bucket = datetime.now().replace(minute=0, second=0, microsecond=0)
+    series = _hist_aqi_series(city, hour_bucket)
+
+    if series is None:
         # If no data for this city, create a placeholder graph
-        fig = go.Figure()
-        fig.add_annotation(
-            text=f"No historical data available for {city}",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14, color="gray")
-        )
-        fig.update_layout(
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            height=200,
-            showlegend=False,
-            xaxis=dict(visible=False),
-            yaxis=dict(visible=False)
-        )
-        return fig
-    
-    # Convert datetime to datetime
-    city_data['datetime'] = pd.to_datetime(city_data['datetime'])
-    
-    # Sort by datetime
-    city_data = city_data.sort_values('datetime')
-    
-    # Get the last 24 hours of data for better synchronization
-    latest_time = city_data['datetime'].max()
-    cutoff_time = latest_time - timedelta(hours=24)
-    recent_data = city_data[city_data['datetime'] >= cutoff_time].copy()
-    
-    # If we don't have 24 hours of data, get the last 20 data points
-    if len(recent_data) < 5:
-        recent_data = city_data.tail(20).copy()
-    
-    if recent_data.empty:
-        # Still no data, create placeholder
-        fig = go.Figure()
-        fig.add_annotation(
-            text=f"No data available for {city}",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14, color="gray")
-        )
-        fig.update_layout(
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            height=200,
-            showlegend=False,
-            xaxis=dict(visible=False),
-            yaxis=dict(visible=False)
-        )
-        return fig
-    
-    # Calculate AQI for each row
-    recent_data['aqi'] = recent_data['pm25'].apply(calc_aqi)
-    
-    # Create the graph
-    fig = go.Figure()
-    
-    # Add bar chart with dark green styling
-    fig.add_trace(go.Bar(
-        x=recent_data['datetime'],
-        y=recent_data['aqi'],
-        marker_color='#2e7d32',
-        name='AQI',
-        hovertemplate='<b>Time:</b> %{x}<br><b>AQI:</b> %{y}<extra></extra>',
-        marker_line_width=0,
-        opacity=0.9
-    ))
-    
-    # Update layout - centered and properly formatted
-    fig.update_layout(
-        title=None,
-        xaxis_title=None,
-        yaxis_title=None,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(size=10),
-        margin=dict(l=40, r=20, t=20, b=40),
-        height=200,
-        showlegend=False,
-        xaxis=dict(
-            showgrid=True,
-            gridcolor='#f0f0f0',
-            tickformat='%m-%d %H:%M',
-            tickmode='auto',
-            nticks=6,
-            tickfont=dict(size=9),
-            tickangle=0
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='#f0f0f0',
-            range=[0, max(recent_data['aqi']) * 1.1 if max(recent_data['aqi']) > 0 else 50],
-            tickfont=dict(size=9),
-            tickmode='linear',
-            dtick=20
-        )
-    )
-    
-    return fig
+        return _placeholder_graph(f"No historical data available for {city}")
 
-def create_aqi_index():
-    """Create AQI index scale component"""
-    return f"""
+    x, aqi = series
+    max_aqi = int(aqi.max())
+
+    # Dark green bar chart - centered and properly formatted
+    return {
+        'data': [{
+            'type': 'bar',
+            'x': x,
+            'y': aqi,
+            'marker': {'color': '#2e7d32', 'line': {'width': 0}},
+            'name': 'AQI',
+            'hovertemplate': '<b>Time:</b> %{x}<br><b>AQI:</b> %{y}<extra></extra>',
+            'opacity': 0.9,
+        }],
+        'layout': {
+            'uirevision': 'constant',
+            'plot_bgcolor': 'rgba(0,0,0,0)',
+            'paper_bgcolor': 'rgba(0,0,0,0)',
+            'font': {'size': 10},
+            'margin': {'l': 40, 'r': 20, 't': 20, 'b': 40},
+            'height': 200,
+            'showlegend': False,
+            'xaxis': {
+                'showgrid': True,
+                'gridcolor': '#f0f0f0',
+                'tickformat': '%m-%d %H:%M',
+                'tickmode': 'auto',
+                'nticks': 6,
+                'tickfont': {'size': 9},
+                'tickangle': 0,
+            },
+            'yaxis': {
+                'showgrid': True,
+                'gridcolor': '#f0f0f0',
+                'range': [0, max_aqi * 1.1 if max_aqi > 0 else 50],
+                'tickfont': {'size': 9},
+                'tickmode': 'linear',
+                'dtick': 20,
+            },
+        },
+    }
+
+_aqi_graph_future = _POOL.submit(create_historical_aqi_graph, _INITIAL_CITY)
+
+# The AQI index scale never varies; build the HTML once at import
+AQI_INDEX_HTML = _minify_html("""
     <div style="
         margin: 30px auto;
         max-width: 1200px;
@@ -685,16 +825,52 @@ def create_aqi_index():
             </div>
         </div>
     </div>
-    """
+    """)
 
-def create_pollutant_cards(city):
-    """Create pollutant cards like AQI.in - improved layout"""
-    if city not in latest_data['site'].values:
-        return "City data not available"
-    
-    city_data = latest_data[latest_data['site'] == city].iloc[0]
-    
-    cards_html = f"""
+# Static skeleton of the pollutant cards section; only the city name
+# and six readings are interpolated per call
+# One pollutant card differs from the next only in its label, reading and
+# trend arrow, so keep a single card template plus a spec row per pollutant
+_CARD_TPL = _minify_html("""
+    <div style="
+        background: #f8f9fa;
+        border: 1px solid #e0e0e0;
+        border-left: 5px solid #00e400;
+        border-radius: 12px;
+        padding: 25px 20px;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
+        cursor: pointer;
+        transition: all 0.3s ease;
+        min-height: 120px;
+        display: flex;
+        flex-direction: row;
+        justify-content: space-between;
+        align-items: center;
+    " onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 8px 25px rgba(0,0,0,0.15)'" onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 4px 12px rgba(0,0,0,0.08)'">
+        <div style="display: flex; flex-direction: column; gap: 5px;">
+            <div style="font-size: 1.1rem; color: #333; font-weight: 500;">{name}</div>
+            <div style="font-size: 0.9rem; color: #666;">({code})</div>
+        </div>
+        <div style="display: flex; align-items: center; gap: 10px;">
+            <div style="font-size: 1.8rem; font-weight: bold; color: #333;">{value} {unit}</div>
+            <div style="font-size: 1.2rem; color: {trend_color};">{trend}</div>
+        </div>
+    </div>
+    """)
+
+# field matches the LATEST_BY_SITE attribute; decimals the reading precision
+_POLLUTANT_CARDS = (
+    {'field': 'pm25', 'name': 'Particulate Matter', 'code': 'PM2.5', 'unit': 'µg/m³', 'decimals': 1, 'trend': '→', 'trend_color': '#666'},
+    {'field': 'pm10', 'name': 'Particulate Matter', 'code': 'PM10', 'unit': 'µg/m³', 'decimals': 1, 'trend': '⚠️', 'trend_color': '#ff0000'},
+    {'field': 'co', 'name': 'Carbon Monoxide', 'code': 'CO', 'unit': 'ppb', 'decimals': 0, 'trend': '→', 'trend_color': '#666'},
+    {'field': 'so2', 'name': 'Sulfur Dioxide', 'code': 'SO2', 'unit': 'ppb', 'decimals': 0, 'trend': '↓', 'trend_color': '#666'},
+    {'field': 'no2', 'name': 'Nitrogen Dioxide', 'code': 'NO2', 'unit': 'ppb', 'decimals': 0, 'trend': '↓', 'trend_color': '#666'},
+    {'field': 'o3', 'name': 'Ozone', 'code': 'O3', 'unit': 'ppb', 'decimals': 0, 'trend': '→', 'trend_color': '#666'},
+)
+
+# Static skeleton of the pollutant cards section; only the city name
+# and the six rendered cards are interpolated per call
+_POLLUTANT_CARDS_TEMPLATE = _minify_html("""
     <div style="
         background: white;
         padding: 40px 60px;
@@ -706,179 +882,78 @@ def create_pollutant_cards(city):
             <h2 style="margin: 0; color: #333; font-size: 1.8rem; font-weight: 600;">Major Air Pollutants</h2>
             <p style="margin: 8px 0 0 0; color: #0066cc; font-size: 1.2rem; font-weight: 500;">{city}</p>
         </div>
-        
-        <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 25px; max-width: 1200px; margin: 0 auto;">
-            <!-- PM2.5 Card -->
-            <div style="
-                background: #f8f9fa;
-                border: 1px solid #e0e0e0;
-                border-left: 5px solid #00e400;
-                border-radius: 12px;
-                padding: 25px 20px;
-                box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-                 cursor: pointer;
-                 transition: all 0.3s ease;
-                min-height: 120px;
-                display: flex;
-                flex-direction: row;
-                justify-content: space-between;
-                align-items: center;
-            " onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 8px 25px rgba(0,0,0,0.15)'" onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 4px 12px rgba(0,0,0,0.08)'">
-                <div style="display: flex; flex-direction: column; gap: 5px;">
-                    <div style="font-size: 1.1rem; color: #333; font-weight: 500;">Particulate Matter</div>
-                    <div style="font-size: 0.9rem; color: #666;">(PM2.5)</div>
-                 </div>
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <div style="font-size: 1.8rem; font-weight: bold; color: #333;">{city_data['pm25']:.1f} µg/m³</div>
-                    <div style="font-size: 1.2rem; color: #666;">→</div>
-                </div>
-            </div>
-            
-            <!-- PM10 Card -->
-            <div style="
-                background: #f8f9fa;
-                border: 1px solid #e0e0e0;
-                border-left: 5px solid #00e400;
-                border-radius: 12px;
-                padding: 25px 20px;
-                box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-                 cursor: pointer;
-                 transition: all 0.3s ease;
-                min-height: 120px;
-                display: flex;
-                flex-direction: row;
-                justify-content: space-between;
-                align-items: center;
-            " onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 8px 25px rgba(0,0,0,0.15)'" onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 4px 12px rgba(0,0,0,0.08)'">
-                <div style="display: flex; flex-direction: column; gap: 5px;">
-                    <div style="font-size: 1.1rem; color: #333; font-weight: 500;">Particulate Matter</div>
-                    <div style="font-size: 0.9rem; color: #666;">(PM10)</div>
-                 </div>
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <div style="font-size: 1.8rem; font-weight: bold; color: #333;">{city_data['pm10']:.1f} µg/m³</div>
-                    <div style="font-size: 1.2rem; color: #ff0000;">⚠️</div>
-                </div>
-            </div>
-            
-            <!-- CO Card -->
-            <div style="
-                background: #f8f9fa;
-                border: 1px solid #e0e0e0;
-                border-left: 5px solid #00e400;
-                border-radius: 12px;
-                padding: 25px 20px;
-                box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-                cursor: pointer;
-                transition: all 0.3s ease;
-                min-height: 120px;
-                display: flex;
-                flex-direction: row;
-                justify-content: space-between;
-                align-items: center;
-            " onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 8px 25px rgba(0,0,0,0.15)'" onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 4px 12px rgba(0,0,0,0.08)'">
-                <div style="display: flex; flex-direction: column; gap: 5px;">
-                    <div style="font-size: 1.1rem; color: #333; font-weight: 500;">Carbon Monoxide</div>
-                    <div style="font-size: 0.9rem; color: #666;">(CO)</div>
-                </div>
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <div style="font-size: 1.8rem; font-weight: bold; color: #333;">{city_data.get('co', 95):.0f} ppb</div>
-                    <div style="font-size: 1.2rem; color: #666;">→</div>
-                </div>
-            </div>
-            
-            <!-- SO2 Card -->
-            <div style="
-                background: #f8f9fa;
-                border: 1px solid #e0e0e0;
-                border-left: 5px solid #00e400;
-                border-radius: 12px;
-                padding: 25px 20px;
-                box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-                cursor: pointer;
-                transition: all 0.3s ease;
-                min-height: 120px;
-                display: flex;
-                flex-direction: row;
-                justify-content: space-between;
-                align-items: center;
-            " onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 8px 25px rgba(0,0,0,0.15)'" onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 4px 12px rgba(0,0,0,0.08)'">
-                <div style="display: flex; flex-direction: column; gap: 5px;">
-                    <div style="font-size: 1.1rem; color: #333; font-weight: 500;">Sulfur Dioxide</div>
-                    <div style="font-size: 0.9rem; color: #666;">(SO2)</div>
-                </div>
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <div style="font-size: 1.8rem; font-weight: bold; color: #333;">{city_data.get('so2', 0):.0f} ppb</div>
-                    <div style="font-size: 1.2rem; color: #666;">↓</div>
-                </div>
-            </div>
-            
-            <!-- NO2 Card -->
-            <div style="
-                background: #f8f9fa;
-                border: 1px solid #e0e0e0;
-                border-left: 5px solid #00e400;
-                border-radius: 12px;
-                padding: 25px 20px;
-                box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-                cursor: pointer;
-                transition: all 0.3s ease;
-                min-height: 120px;
-                display: flex;
-                flex-direction: row;
-                justify-content: space-between;
-                align-items: center;
-            " onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 8px 25px rgba(0,0,0,0.15)'" onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 4px 12px rgba(0,0,0,0.08)'">
-                <div style="display: flex; flex-direction: column; gap: 5px;">
-                    <div style="font-size: 1.1rem; color: #333; font-weight: 500;">Nitrogen Dioxide</div>
-                    <div style="font-size: 0.9rem; color: #666;">(NO2)</div>
-                </div>
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <div style="font-size: 1.8rem; font-weight: bold; color: #333;">{city_data['no2']:.0f} ppb</div>
-                    <div style="font-size: 1.2rem; color: #666;">↓</div>
-                </div>
-            </div>
-            
-            <!-- O3 Card -->
-            <div style="
-                background: #f8f9fa;
-                border: 1px solid #e0e0e0;
-                border-left: 5px solid #00e400;
-                border-radius: 12px;
-                padding: 25px 20px;
-                box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-                cursor: pointer;
-                transition: all 0.3s ease;
-                min-height: 120px;
-                display: flex;
-                flex-direction: row;
-                justify-content: space-between;
-                align-items: center;
-            " onmouseover="this.style.transform='translateY(-3px)'; this.style.boxShadow='0 8px 25px rgba(0,0,0,0.15)'" onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 4px 12px rgba(0,0,0,0.08)'">
-                <div style="display: flex; flex-direction: column; gap: 5px;">
-                    <div style="font-size: 1.1rem; color: #333; font-weight: 500;">Ozone</div>
-                    <div style="font-size: 0.9rem; color: #666;">(O3)</div>
-                </div>
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <div style="font-size: 1.8rem; font-weight: bold; color: #333;">{city_data['o3']:.0f} ppb</div>
-                    <div style="font-size: 1.2rem; color: #666;">→</div>
-                </div>
-            </div>
-        </div>
+        <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 25px; max-width: 1200px; margin: 0 auto;">{cards}</div>
     </div>
-    """
-    
-    return cards_html
+    """)
+
+# Bake every static field into literal fragments once at import, leaving
+# only the readings (and the city name) to splice in per render: each card
+# becomes a (head, field, format-spec, tail) row around its {value} slot
+def _card_fragments():
+    rows = []
+    for card in _POLLUTANT_CARDS:
+        head, tail = _CARD_TPL.format_map({
+            'name': card['name'],
+            'code': card['code'],
+            'unit': card['unit'],
+            'trend': card['trend'],
+            'trend_color': card['trend_color'],
+            'value': '\x00',
+        }).split('\x00')
+        rows.append((head, card['field'], f".{card['decimals']}f", tail))
+    return tuple(rows)
+
+_CARD_FRAGMENTS = _card_fragments()
+_SECTION_HEAD, _rest = _POLLUTANT_CARDS_TEMPLATE.split('{city}')
+_SECTION_MID, _SECTION_TAIL = _rest.split('{cards}')
+del _rest
+
+@functools.lru_cache(maxsize=64)
+def _render_pollutant_cards(city, data_version):
+    """Create pollutant cards like AQI.in - improved layout"""
+    if city not in LATEST_BY_SITE:
+        return "City data not available"
+
+    row = LATEST_BY_SITE[city]
+
+    # Interleave the prebuilt literals with the formatted readings and
+    # join once, instead of re-scanning the whole template for fields
+    parts = [_SECTION_HEAD, city, _SECTION_MID]
+    for head, field, spec, tail in _CARD_FRAGMENTS:
+        parts.append(head)
+        parts.append(format(getattr(row, field), spec))
+        parts.append(tail)
+    parts.append(_SECTION_TAIL)
+    return "".join(parts)
+
+def create_pollutant_cards(city):
+    """Pollutant cards HTML, cached per (city, data version)"""
+    return _render_pollutant_cards(city, _DATA_VERSION)
 
 # Create pollutant cards
-pollutant_cards = pn.pane.HTML(create_pollutant_cards(cities[0] if cities else None))
+_pollutant_cards_future = _POOL.submit(create_pollutant_cards, _INITIAL_CITY)
 
-# Create historical AQI graph with width control - centered
-aqi_graph = pn.pane.Plotly(
-    create_historical_aqi_graph(cities[0] if cities else None),
-    width=1200,
-    height=250,
-    align='center'
-)
+def _owned_graph_spec(spec):
+    """Copy the mutable levels of a cached graph spec so the pane owns them"""
+    if not spec or not spec.get('data'):
+        return spec
+    return {
+        'data': [dict(spec['data'][0])],
+        'layout': {**spec['layout'], 'yaxis': dict(spec['layout']['yaxis'])},
+    }
+
+def _apply_aqi_graph_spec(spec):
+    """Write a cached graph spec into the pane's persistent spec and retrigger"""
+    current = aqi_graph.object
+    if not spec or not spec.get('data') or not current or not current.get('data'):
+        # Placeholder or empty specs carry no reusable trace; swap wholesale
+        aqi_graph.object = _owned_graph_spec(spec)
+        return
+    trace = current['data'][0]
+    trace['x'] = spec['data'][0]['x']
+    trace['y'] = spec['data'][0]['y']
+    current['layout']['yaxis']['range'] = spec['layout']['yaxis']['range']
+    aqi_graph.param.trigger('object')
 
 # Create graph header
 def create_graph_header(city):
@@ -946,7 +1021,22 @@ def create_graph_header(city):
     </div>
     """
 
-graph_header = pn.pane.HTML(create_graph_header(cities[0] if cities else None))
+_graph_header_future = _POOL.submit(create_graph_header, _INITIAL_CITY)
+
+# Collect the parallel initial builds into their panes. The AQI graph pane
+# keeps one spec dict for its whole life and city changes mutate it in
+# place, so Plotly restyles the existing bar trace instead of rebuilding
+# the plot
+map_pane = pn.pane.Plotly(_map_future.result(), height=450)
+aqi_card = pn.pane.HTML(_aqi_card_future.result())
+pollutant_cards = pn.pane.HTML(_pollutant_cards_future.result())
+aqi_graph = pn.pane.Plotly(
+    _owned_graph_spec(_aqi_graph_future.result()),
+    width=1200,
+    height=250,
+    align='center'
+)
+graph_header = pn.pane.HTML(_graph_header_future.result())
 
 # Charts section with pollutant cards and graph as separate sections - properly centered
 charts_row = pn.Column(
@@ -958,7 +1048,7 @@ charts_row = pn.Column(
 )
 
 # Create AQI index component
-aqi_index = pn.pane.HTML(create_aqi_index())
+aqi_index = pn.pane.HTML(AQI_INDEX_HTML)
 
 # Main dashboard layout - properly centered
 dashboard = pn.Column(
@@ -972,30 +1062,28 @@ dashboard = pn.Column(
 )
 
 # --- INTERACTIVITY ---
+# City changes rebuild the components concurrently on the shared pool;
+# only the pane assignments happen on the calling thread
 @pn.depends(city_selector.param.value, watch=True)
-def update_map(city):
-    """Update map when city changes"""
-    map_pane.object = create_map(city)
-
-@pn.depends(city_selector.param.value, watch=True)
-def update_aqi_card(city):
-    """Update AQI card when city changes"""
-    aqi_card.object = create_aqi_card(city)
-
-@pn.depends(city_selector.param.value, watch=True)
-def update_pollutant_cards(city):
-    """Update pollutant cards when city changes"""
-    pollutant_cards.object = create_pollutant_cards(city)
-
-@pn.depends(city_selector.param.value, watch=True)
-def update_aqi_graph(city):
-    """Update AQI graph when city changes"""
-    aqi_graph.object = create_historical_aqi_graph(city)
-
-@pn.depends(city_selector.param.value, watch=True)
-def update_graph_header(city):
-    """Update graph header when city changes"""
-    graph_header.object = create_graph_header(city)
+def update_dashboard(city):
+    """Rebuild all city-dependent components when the city changes"""
+    futures = {
+        map_pane: _POOL.submit(create_map, city),
+        aqi_card: _POOL.submit(create_aqi_card, city),
+        pollutant_cards: _POOL.submit(create_pollutant_cards, city),
+        graph_header: _POOL.submit(create_graph_header, city),
+    }
+    graph_future = _POOL.submit(create_historical_aqi_graph, city)
+    # Hold the document while assigning so the browser receives one
+    # coalesced patch instead of five separate updates; skip panes whose
+    # (cached) content is unchanged so no diff is computed or shipped
+    with pn.io.hold():
+        for pane, future in futures.items():
+            result = future.result()
+            if pane.object is not result:
+                pane.object = result
+        # The AQI graph reuses its figure; only the trace arrays change
+        _apply_aqi_graph_spec(graph_future.result())
 
 # --- RUN DASHBOARD ---
 if __name__ == '__main__':
@@ -5,6 +5,7 @@ Repository: https://github.com/rishika84/panel_air_quality_dashboard.git
 """
 
 import os
+import shlex
 import subprocess
 import sys
 
@@ -25,12 +26,10 @@ def check_files():
         "render.yaml"
     ]
     
-    missing_files = []
-    for file in required_files:
-        if not os.path.exists(file):
-            missing_files.append(file)
-    
-    return missing_files
+    # One directory scan instead of a stat() per file
+    with os.scandir(".") as entries:
+        present = {entry.name for entry in entries}
+    return [file for file in required_files if file not in present]
 
 def setup_repository():
     """Set up git repository and push to existing repo"""
@@ -38,33 +37,21 @@ def setup_repository():
     
     try:
         print("🔧 Setting up Git repository...")
-        
-        # Initialize git
-        subprocess.run(["git", "init"], check=True)
-        print("✅ Git initialized")
-        
-        # Add remote
-        subprocess.run(["git", "remote", "add", "origin", repo_url], check=True)
-        print("✅ Remote added")
-        
-        # Add all files
-        subprocess.run(["git", "add", "."], check=True)
-        print("✅ Files added to git")
-        
-        # Commit
-        subprocess.run(["git", "commit", "-m", "Initial dashboard deployment"], check=True)
-        print("✅ Files committed")
-        
-        # Set main branch
-        subprocess.run(["git", "branch", "-M", "main"], check=True)
-        print("✅ Set main branch")
-        
-        # Push
-        subprocess.run(["git", "push", "-u", "origin", "main"], check=True)
-        print("✅ Files pushed to GitHub")
-        
+
+        # One shell invocation instead of six separate git process spawns;
+        # && chaining stops at the first failing step
+        script = " && ".join([
+            "git init -b main",
+            f"git remote add origin {shlex.quote(repo_url)}",
+            "git add .",
+            "git commit -m 'Initial dashboard deployment'",
+            "git push -u origin main",
+        ])
+        subprocess.run(script, shell=True, check=True)
+        print("✅ Repository initialized, committed and pushed to GitHub")
+
         return True
-        
+
     except subprocess.CalledProcessError as e:
         print(f"❌ Git error: {e}")
         return False
@@ -89,7 +76,7 @@ def render_deployment_instructions():
     print("   • Name: 'air-quality-dashboard'")
     print("   • Environment: 'Python 3'")
     print("   • Build Command: 'pip install -r requirements.txt'")
-    print("   • Start Command: 'panel serve panel_air_quality_dashboard.py --address 0.0.0.0 --port $PORT --allow-websocket-origin=*'")
+    print("   • Start Command: 'panel serve panel_air_quality_dashboard.py --address 0.0.0.0 --port $PORT --allow-websocket-origin=* --websocket-compression-level 9 --websocket-max-message-size 20000000'")
     print("   • Plan: Free")
     
     print("\n4️⃣ DEPLOY:")
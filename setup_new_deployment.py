@@ -5,9 +5,9 @@ This script helps you create a new repository and prepare for deployment
 """
 
 import os
+import shlex
 import subprocess
 import sys
-import webbrowser
 
 def check_git():
     """Check if git is installed"""
@@ -26,12 +26,10 @@ def check_files():
         "render.yaml"
     ]
     
-    missing_files = []
-    for file in required_files:
-        if not os.path.exists(file):
-            missing_files.append(file)
-    
-    return missing_files
+    # One directory scan instead of a stat() per file
+    with os.scandir(".") as entries:
+        present = {entry.name for entry in entries}
+    return [file for file in required_files if file not in present]
 
 def create_new_repo_instructions():
     """Provide instructions for creating a new GitHub repository"""
@@ -62,33 +60,21 @@ def setup_git_repo(repo_url):
     """Set up git repository and push files"""
     try:
         print("\n🔧 Setting up Git repository...")
-        
-        # Initialize git
-        subprocess.run(["git", "init"], check=True)
-        print("✅ Git initialized")
-        
-        # Add all files
-        subprocess.run(["git", "add", "."], check=True)
-        print("✅ Files added to git")
-        
-        # Commit
-        subprocess.run(["git", "commit", "-m", "Initial dashboard deployment"], check=True)
-        print("✅ Files committed")
-        
-        # Set main branch
-        subprocess.run(["git", "branch", "-M", "main"], check=True)
-        print("✅ Set main branch")
-        
-        # Add remote
-        subprocess.run(["git", "remote", "add", "origin", repo_url], check=True)
-        print("✅ Remote added")
-        
-        # Push
-        subprocess.run(["git", "push", "-u", "origin", "main"], check=True)
-        print("✅ Files pushed to GitHub")
-        
+
+        # One shell invocation instead of six separate git process spawns;
+        # && chaining stops at the first failing step
+        script = " && ".join([
+            "git init -b main",
+            "git add .",
+            "git commit -m 'Initial dashboard deployment'",
+            f"git remote add origin {shlex.quote(repo_url)}",
+            "git push -u origin main",
+        ])
+        subprocess.run(script, shell=True, check=True)
+        print("✅ Repository initialized, committed and pushed to GitHub")
+
         return True
-        
+
     except subprocess.CalledProcessError as e:
         print(f"❌ Git error: {e}")
         return False
@@ -113,7 +99,7 @@ def render_deployment_instructions():
     print("   • Name: 'air-quality-dashboard'")
     print("   • Environment: 'Python 3'")
     print("   • Build Command: 'pip install -r requirements.txt'")
-    print("   • Start Command: 'panel serve panel_air_quality_dashboard.py --address 0.0.0.0 --port $PORT --allow-websocket-origin=*'")
+    print("   • Start Command: 'panel serve panel_air_quality_dashboard.py --address 0.0.0.0 --port $PORT --allow-websocket-origin=* --websocket-compression-level 9 --websocket-max-message-size 20000000'")
     print("   • Plan: Free")
     
     print("\n4️⃣ DEPLOY:")
@@ -168,6 +154,7 @@ def main():
         # Ask if user wants to open Render.com
         open_render = input("\n🌐 Open Render.com in browser? (y/n): ").lower()
         if open_render == 'y':
+            import webbrowser
             webbrowser.open("https://render.com")
     
     else: